@@ -1,19 +1,91 @@
 # Jonathan Ermias
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 import tkinter as tk
+import tkinter.font as tkFont
 from tkinter import filedialog, messagebox
 from SyntaxAnalyzer import analyze_code
-import re
+
+# shared tag name so every tag operation reuses the same string object
+_HL = 'highlight'
+
+@lru_cache(maxsize=1024)
+def _line_range(line_num):
+    """
+    return the cached (start, end) text indices covering a whole line.
+    """
+    return (f"{line_num}.0", f"{line_num}.0 lineend")
+
+def _extract_line_num(issue):
+    """
+    pull the number out of a 'line N' marker using plain string scanning.
+    keeps looking past occurrences of the word 'line' that have no number
+    after them (e.g. in the message text), mirroring the old regex search.
+    returns None if the issue carries no line marker.
+    """
+    length = len(issue)
+    i = issue.find('line ')
+    while i >= 0:
+        j = i + 5
+        k = j
+        while k < length and issue[k].isdigit():
+            k += 1
+        if k > j:
+            return int(issue[j:k])
+        i = issue.find('line ', j)
+    return None
+
+# persistent single-worker pool so the analyzer runs outside the GIL of
+# the UI process; created lazily on the first analysis
+_pool = None
 
 def analyze_input_code():
     """
-    retrieve the code from the input widget, analyze it, display the results, and highlight any issues.
+    retrieve the code from the input widget and analyze it in a worker
+    process so the interface never stalls, even on CPU-bound analyses.
     """
-    input_code = code_input.get("1.0", tk.END).rstrip()
-    if not input_code.strip():
+    # O(1) emptiness test via index comparison instead of copying the buffer
+    if code_input.compare("end-1c", "==", "1.0"):
         messagebox.showerror("ERROR", "Please enter or upload code for analysis.")
         return
 
-    results = analyze_code(input_code)
+    input_code = code_input.get("1.0", "end-1c")
+    global _pool
+    if _pool is None:
+        _pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    analyze_button.config(state=tk.DISABLED)
+    future = _pool.submit(analyze_code, input_code)
+
+    def _poll():
+        # check completion from the event loop instead of blocking on result()
+        if not future.done():
+            root.after(50, _poll)
+            return
+        global _pool
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            # the worker died (e.g. out of memory on a huge input); a broken
+            # pool stays broken, so drop it and let the next click rebuild it
+            _pool = None
+            analyze_button.config(state=tk.NORMAL)
+            messagebox.showerror("ERROR", "The analysis process crashed. Please try again.")
+            return
+        except Exception as e:
+            analyze_button.config(state=tk.NORMAL)
+            messagebox.showerror("ERROR", f"Analysis failed: {e}")
+            return
+        _finish_analysis(results)
+
+    _poll()
+
+def _finish_analysis(results):
+    """
+    re-enable the analyze button, display the results, and highlight any
+    issues; always runs on the main thread.
+    """
+    analyze_button.config(state=tk.NORMAL)
     display_results(results)
     highlight_issues(results)
 
@@ -28,10 +100,19 @@ def upload_file():
         return
 
     try:
+        # read in fixed-size chunks and join once to bound peak memory
+        parts = []
         with open(file_path, "r", encoding="utf-8") as file:
-            code = file.read()
-        code_input.delete("1.0", tk.END)
-        code_input.insert(tk.END, code)
+            while (chunk := file.read(1 << 20)):
+                parts.append(chunk)
+        code = "".join(parts)
+        # suppress configure-driven redraws while the buffer is replaced
+        code_input.unbind('<Configure>')
+        try:
+            code_input.delete("1.0", tk.END)
+            code_input.insert(tk.END, code)
+        finally:
+            code_input.bind('<Configure>', update_line_numbers)
         update_line_numbers()
     except Exception as e:
         messagebox.showerror("error", f"failed to open file: {e}")
@@ -44,7 +125,20 @@ def display_results(results):
     result_output.delete("1.0", tk.END)
 
     if results:
-        result_output.insert(tk.END, "\n".join(results))
+        # insert in ~64 KB chunks so huge result lists never materialize
+        # as one giant string
+        buf = []
+        size = 0
+        for issue in results:
+            buf.append(issue)
+            buf.append("\n")
+            size += len(issue) + 1
+            if size >= 65536:
+                result_output.insert(tk.END, "".join(buf))
+                buf.clear()
+                size = 0
+        if buf:
+            result_output.insert(tk.END, "".join(buf))
     else:
         result_output.insert(tk.END, "no issues found!")
 
@@ -54,179 +148,281 @@ def highlight_issues(results):
     """
     highlight the lines in the code input where issues were found.
     """
-    code_input.tag_remove('highlight', '1.0', tk.END)
+    code_input.tag_remove(_HL, '1.0', tk.END)
+    seen = set()
+    ranges = []
     for issue in results:
-        match = re.search(r'line (\d+)', issue)
-        if match:
-            line_num = int(match.group(1))
-            start = f"{line_num}.0"
-            end = f"{line_num}.0 lineend"
-            code_input.tag_add('highlight', start, end)
-    code_input.tag_configure('highlight', background='#FDFF78')
+        line_num = _extract_line_num(issue)
+        if line_num is None or line_num in seen:
+            # several issues often point at the same line; tag it once
+            continue
+        seen.add(line_num)
+        start, end = _line_range(line_num)
+        ranges.append(start)
+        ranges.append(end)
+    if ranges:
+        # one variadic tag_add instead of a Tcl round-trip per issue
+        code_input.tag_add(_HL, *ranges)
+
+# canvas item ids keyed by line number; items persist across redraws and
+# only the ones that scroll out of view are deleted
+_line_items = {}
+# whether a deferred line-number redraw is already scheduled
+_pending_update = False
+# (top index, bottom index, canvas width) of the last completed redraw
+_last_state = None
+# alternating row backgrounds indexed by line number parity
+_ROW_COLORS = ('#D3D3D3', '#FFFFFF')
 
 def update_line_numbers(event=None):
+    """
+    schedule a single deferred line-number redraw via after_idle so bursts
+    of events (keystrokes, scrolls, configure) collapse into one rebuild.
+    """
+    global _pending_update
+    if not _pending_update:
+        _pending_update = True
+        root.after_idle(_run_update_line_numbers)
+
+def _run_update_line_numbers():
+    """
+    clear the pending flag and perform the actual redraw.
+    """
+    global _pending_update
+    _pending_update = False
+    _do_update_line_numbers()
+
+def _do_update_line_numbers():
     """
     update the line numbers in the line_numbers canvas widget.
+    existing canvas items are moved and reconfigured in place instead of
+    being destroyed and recreated on every redraw.
     """
-    line_numbers_canvas.delete('all')
+    global _last_state
     i = code_input.index('@0,0')
-    while True:
-        dline = code_input.dlineinfo(i)
-        if dline is None:
-            break
-        y = dline[1]
-        line_number = str(i).split('.')[0]
-        color = '#D3D3D3' if int(line_number) % 2 == 0 else '#FFFFFF'
-        # draw the background rectangle
-        line_numbers_canvas.create_rectangle(
-            0, y, line_numbers_canvas.winfo_width(), y + dline[3],
-            fill=color, outline=''
-        )
-        # draw the line number text
-        line_numbers_canvas.create_text(
-            2, y, anchor='nw', text=line_number, fill=fg_color,
-            font=('Consolas', 12)
-        )
-        i = code_input.index(f"{i}+1line")
+    canvas_w = line_numbers_canvas.winfo_width()  # one Tk round-trip, not one per line
+    canvas_h = line_numbers_canvas.winfo_height()
+    bottom = code_input.index(f"@0,{canvas_h}")
+    state = (i, bottom, canvas_w)
+    if state == _last_state:
+        # nothing visible has moved; skip the redraw entirely
+        return
+    _last_state = state
+    visible = set()
+    ln = int(i.split('.', 1)[0])  # parsed once; stepped as a plain int per row
+    last_ln = int(code_input.index('end-1c').split('.', 1)[0])
+    first = code_input.dlineinfo(f"{ln}.0")
+    if first is not None:
+        # with wrap='none' every line shares the same pixel height, so one
+        # dlineinfo query fixes the geometry for the whole viewport
+        y = first[1]
+        line_h = first[3]
+        while y < canvas_h and ln <= last_ln:
+            visible.add(ln)
+            items = _line_items.get(ln)
+            if items is not None:
+                # text and color are fixed per line number; only move the items
+                rect_id, text_id = items
+                line_numbers_canvas.coords(rect_id, 0, y, canvas_w, y + line_h)
+                line_numbers_canvas.coords(text_id, 2, y)
+            else:
+                # draw the background rectangle
+                rect_id = line_numbers_canvas.create_rectangle(
+                    0, y, canvas_w, y + line_h,
+                    fill=_ROW_COLORS[ln & 1], outline=''
+                )
+                # draw the line number text
+                text_id = line_numbers_canvas.create_text(
+                    2, y, anchor='nw', text=str(ln), fill=fg_color,
+                    font=_line_font
+                )
+                _line_items[ln] = (rect_id, text_id)
+            ln += 1
+            y += line_h
+    # delete only the items whose lines scrolled out of view
+    for stale in set(_line_items) - visible:
+        rect_id, text_id = _line_items.pop(stale)
+        line_numbers_canvas.delete(rect_id)
+        line_numbers_canvas.delete(text_id)
+
+# pending after-handle for the deferred post-scroll redraw
+_scroll_after = None
 
 def on_scroll(*args):
     """
-    scroll the code_input and line_numbers widgets together.
+    scroll the code_input and line_numbers widgets together, deferring the
+    line-number rebuild until the drag pauses so intermediate positions
+    are dropped.
     """
     code_input.yview(*args)
     line_numbers_canvas.yview(*args)
+    global _scroll_after
+    if _scroll_after is not None:
+        root.after_cancel(_scroll_after)
+    _scroll_after = root.after(30, _finish_scroll)
+
+def _finish_scroll():
+    """
+    clear the pending scroll handle and redraw the line numbers.
+    """
+    global _scroll_after
+    _scroll_after = None
     update_line_numbers()
 
 def on_change(event):
     """
-    handle scroll events to keep line numbers and code input synchronized.
+    handle mouse-wheel events to keep line numbers and code input synchronized.
+    on linux the wheel arrives as Button-4/Button-5 with a zero delta, so
+    branch on the button number before falling back to the windows/macos delta.
     """
-    code_input.yview_scroll(int(-1*(event.delta/120)), "units")
-    line_numbers_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    if getattr(event, 'num', None) == 4:
+        delta = -1
+    elif getattr(event, 'num', None) == 5:
+        delta = 1
+    else:
+        delta = int(-1*(event.delta/120))
+    code_input.yview_scroll(delta, "units")
     update_line_numbers()
 
-# create the main application window
-root = tk.Tk()
-root.title("static analysis tool")
-root.geometry("900x700")
-bg_color = '#808080'  # grey background
-root.configure(bg=bg_color)
-
-# define color variables
-fg_color = '#000000'          # black text color
-button_color = '#FDFF78'      # yellow button color
-button_text_color = '#000000' # black text on buttons
-text_box_color = '#FFFFFF'    # white background for text box
-text_box_fg_color = '#000000' # black text color
-
-# input frame for code entry and buttons
-input_frame = tk.Frame(root, bg=bg_color)
-input_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-# label for code input
-input_label = tk.Label(
-    input_frame,
-    text="Enter or Upload Python Code:",
-    bg=bg_color,
-    fg=fg_color,
-    font=('Helvetica', 12, 'bold')
-)
-input_label.pack(anchor='w', padx=5, pady=5)
-
-# frame for line numbers and code input
-code_frame = tk.Frame(input_frame)
-code_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-# scrollbar for code input and line numbers
-scrollbar = tk.Scrollbar(code_frame)
-scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-# canvas widget for line numbers
-line_numbers_canvas = tk.Canvas(
-    code_frame,
-    width=40,
-    bg=text_box_color,
-    highlightthickness=0
-)
-line_numbers_canvas.pack(side=tk.LEFT, fill=tk.Y)
-
-# text box for direct code input
-code_input = tk.Text(
-    code_frame,
-    height=15,
-    wrap='none',
-    bg=text_box_color,
-    fg=text_box_fg_color,
-    insertbackground=text_box_fg_color,
-    font=('Consolas', 12),
-    undo=True,
-    yscrollcommand=scrollbar.set
-)
-code_input.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-scrollbar.config(command=on_scroll)
-
-# bind events for updating line numbers and scrolling
-code_input.bind('<KeyRelease>', update_line_numbers)
-code_input.bind('<MouseWheel>', on_change)  # windows and macos
-code_input.bind('<Button-4>', on_change)    # linux scroll up
-code_input.bind('<Button-5>', on_change)    # linux scroll down
-code_input.bind('<FocusIn>', update_line_numbers)
-code_input.bind('<Configure>', update_line_numbers)
-line_numbers_canvas.bind('<MouseWheel>', on_change)
-
-# buttons for file upload and analysis
-button_frame = tk.Frame(input_frame, bg=bg_color)
-button_frame.pack(fill=tk.X, padx=5, pady=5)
-
-upload_button = tk.Button(
-    button_frame,
-    text="UPLOAD",
-    command=upload_file,
-    bg=button_color,
-    fg=button_text_color,
-    font=('Helvetica', 10, 'bold')
-)
-upload_button.pack(side=tk.LEFT, padx=5)
-
-analyze_button = tk.Button(
-    button_frame,
-    text="ANALYZE",
-    command=analyze_input_code,
-    bg=button_color,
-    fg=button_text_color,
-    font=('Helvetica', 10, 'bold')
-)
-analyze_button.pack(side=tk.RIGHT, padx=5)
-
-# output frame for displaying results
-output_frame = tk.Frame(root, bg=bg_color)
-output_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-# label for analysis results
-output_label = tk.Label(
-    output_frame,
-    text="Result of Analysis:",
-    bg=bg_color,
-    fg=fg_color,
-    font=('Helvetica', 12, 'bold')
-)
-output_label.pack(anchor='w', padx=5, pady=5)
-
-# text widget for displaying analysis results
-result_output = tk.Text(
-    output_frame,
-    height=15,
-    wrap='word',
-    bg=text_box_color,
-    fg=text_box_fg_color,
-    state=tk.DISABLED,
-    font=('Consolas', 12),
-    highlightthickness=1,
-    highlightbackground='black',
-    relief='solid',
-    borderwidth=1
-)
-result_output.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-
-# start the main event loop
-root.mainloop()
+def main():
+    """
+    build the application window, wire up the widgets, and start the event
+    loop. kept inside a function so worker processes spawned for analysis
+    can import this module without constructing a second GUI.
+    """
+    global root, _line_font, fg_color
+    global code_input, line_numbers_canvas, result_output, analyze_button
+
+    # create the main application window
+    root = tk.Tk()
+    root.title("static analysis tool")
+    root.geometry("900x700")
+    bg_color = '#808080'  # grey background
+    root.configure(bg=bg_color)
+
+    # single named font shared by every line-number text item
+    _line_font = tkFont.Font(family='Consolas', size=12)
+
+    # define color variables
+    fg_color = '#000000'          # black text color
+    button_color = '#FDFF78'      # yellow button color
+    button_text_color = '#000000' # black text on buttons
+    text_box_color = '#FFFFFF'    # white background for text box
+    text_box_fg_color = '#000000' # black text color
+
+    # input frame for code entry and buttons
+    input_frame = tk.Frame(root, bg=bg_color)
+    input_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    # label for code input
+    input_label = tk.Label(
+        input_frame,
+        text="Enter or Upload Python Code:",
+        bg=bg_color,
+        fg=fg_color,
+        font=('Helvetica', 12, 'bold')
+    )
+    input_label.pack(anchor='w', padx=5, pady=5)
+
+    # frame for line numbers and code input
+    code_frame = tk.Frame(input_frame)
+    code_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    # scrollbar for code input and line numbers
+    scrollbar = tk.Scrollbar(code_frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # canvas widget for line numbers
+    line_numbers_canvas = tk.Canvas(
+        code_frame,
+        width=40,
+        bg=text_box_color,
+        highlightthickness=0
+    )
+    line_numbers_canvas.pack(side=tk.LEFT, fill=tk.Y)
+
+    # text box for direct code input
+    code_input = tk.Text(
+        code_frame,
+        height=15,
+        wrap='none',
+        bg=text_box_color,
+        fg=text_box_fg_color,
+        insertbackground=text_box_fg_color,
+        font=('Consolas', 12),
+        undo=True,
+        yscrollcommand=scrollbar.set
+    )
+    code_input.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    # configure the highlight tag once; highlight_issues only adds/removes ranges
+    code_input.tag_configure('highlight', background='#FDFF78')
+    scrollbar.config(command=on_scroll)
+
+    # bind events for updating line numbers and scrolling
+    code_input.bind('<KeyRelease>', update_line_numbers)
+    code_input.bind('<MouseWheel>', on_change)  # windows and macos
+    code_input.bind('<Button-4>', on_change)    # linux scroll up
+    code_input.bind('<Button-5>', on_change)    # linux scroll down
+    code_input.bind('<FocusIn>', update_line_numbers)
+    code_input.bind('<Configure>', update_line_numbers)
+    line_numbers_canvas.bind('<MouseWheel>', on_change)
+
+    # buttons for file upload and analysis
+    button_frame = tk.Frame(input_frame, bg=bg_color)
+    button_frame.pack(fill=tk.X, padx=5, pady=5)
+
+    upload_button = tk.Button(
+        button_frame,
+        text="UPLOAD",
+        command=upload_file,
+        bg=button_color,
+        fg=button_text_color,
+        font=('Helvetica', 10, 'bold')
+    )
+    upload_button.pack(side=tk.LEFT, padx=5)
+
+    analyze_button = tk.Button(
+        button_frame,
+        text="ANALYZE",
+        command=analyze_input_code,
+        bg=button_color,
+        fg=button_text_color,
+        font=('Helvetica', 10, 'bold')
+    )
+    analyze_button.pack(side=tk.RIGHT, padx=5)
+
+    # output frame for displaying results
+    output_frame = tk.Frame(root, bg=bg_color)
+    output_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    # label for analysis results
+    output_label = tk.Label(
+        output_frame,
+        text="Result of Analysis:",
+        bg=bg_color,
+        fg=fg_color,
+        font=('Helvetica', 12, 'bold')
+    )
+    output_label.pack(anchor='w', padx=5, pady=5)
+
+    # text widget for displaying analysis results
+    result_output = tk.Text(
+        output_frame,
+        height=15,
+        wrap='word',
+        bg=text_box_color,
+        fg=text_box_fg_color,
+        state=tk.DISABLED,
+        font=('Consolas', 12),
+        highlightthickness=1,
+        highlightbackground='black',
+        relief='solid',
+        borderwidth=1
+    )
+    result_output.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    # start the main event loop
+    root.mainloop()
+
+if __name__ == '__main__':
+    main()
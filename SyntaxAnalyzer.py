@@ -1,142 +1,265 @@
 # Jonathan Ermias
 import ast
 import re
+import sys
+import hashlib
 import keyword
 import builtins
+from functools import lru_cache
+
+# naming-convention patterns compiled once at import; the bound .match
+# methods skip the re-module cache lookup on every visited node
+_SNAKE_CASE = re.compile(r'^[a-z_][a-z0-9_]*$').match
+_CAP_WORDS = re.compile(r'^[A-Z][a-zA-Z0-9]*$').match
+_UPPER_CASE = re.compile(r'^[A-Z_][A-Z0-9_]*$').match
+
+# built-in functions, keywords, and methods of the basic built-in types,
+# collected once at import instead of on every CodeAnalyzer construction
+_BUILT_IN_NAMES = frozenset(dir(builtins)) | frozenset(keyword.kwlist) | frozenset(
+    method
+    for typ in (str, list, dict, tuple, set)
+    for method in dir(typ)
+    if not method.startswith('__')
+)
+
+# identifiers repeat heavily across a file, so each naming predicate is
+# memoized: repeat lookups become a dict hit instead of a regex walk
+@lru_cache(maxsize=None)
+def _is_snake(name):
+    """return whether the identifier is snake_case."""
+    return _SNAKE_CASE(name) is not None
+
+@lru_cache(maxsize=None)
+def _is_capwords(name):
+    """return whether the identifier is CapWords."""
+    return _CAP_WORDS(name) is not None
+
+@lru_cache(maxsize=None)
+def _is_upper_const(name):
+    """return whether the identifier is UPPER_CASE_WITH_UNDERSCORES."""
+    return _UPPER_CASE(name) is not None
+
+@lru_cache(maxsize=None)
+def _case_bits(name):
+    """scan the identifier once and report its letter cases as a bitmask:
+    bit 1 set if any ASCII uppercase letter appears, bit 2 if any lowercase.
+    stops early once both cases have been seen."""
+    bits = 0
+    for ch in name:
+        o = ord(ch)
+        if 65 <= o <= 90:
+            bits |= 1
+        elif 97 <= o <= 122:
+            bits |= 2
+        if bits == 3:
+            break
+    return bits
+
+# constant-kind codes returned by _const_kind
+_NOT_CONST, _CONST_NONE, _CONST_BOOL, _CONST_OTHER = 0, 1, 2, 3
+
+def _const_kind(node):
+    """classify a node as not-a-constant, None, bool, or another constant,
+    so visit_Compare inspects each operand exactly once."""
+    if type(node) is not ast.Constant:
+        return _NOT_CONST
+    value = node.value
+    if value is None:
+        return _CONST_NONE
+    if type(value) is bool:
+        return _CONST_BOOL
+    return _CONST_OTHER
+
+def _has_break(node):
+    """return whether the loop contains a break at its own level.
+    stops at the first break found, and skips nested functions, classes,
+    and inner loops, since a break inside those cannot exit this loop.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.Break):
+            return True
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef,
+                              ast.ClassDef, ast.For, ast.AsyncFor, ast.While)):
+            continue
+        if _has_break(child):
+            return True
+    return False
+
+class CodeAnalyzer:
+    # fixed attribute layout: slot access is faster than a per-instance
+    # __dict__ lookup and every analyzer attribute is known up front.
+    # the ast.NodeVisitor base was dropped so the slots take effect; its
+    # dispatch was already replaced by the _DISPATCH table in visit().
+    __slots__ = (
+        'issues', '_issue_keys', 'assignments', 'usages', 'loop_depth',
+        'scopes', 'current_function', 'functions', 'import_lineno',
+        'used_imports', 'class_names', 'global_scope', 'current_scope',
+        '_visible', '_visible_stack', 'global_vars', 'nonlocal_vars',
+        '_with_ctx_ids', 'built_in_names', 'module_level_assignments',
+    )
 
-class CodeAnalyzer(ast.NodeVisitor):
     def __init__(self):
         """initialize the analyzer to collect issues, track variables, and define scopes.
         this class traverses the abstract syntax tree of python code to detect various
         coding issues such as naming conventions, unused variables, and potential logical errors.
         it maintains scopes to accurately track variable definitions and usages.
         """
-        super().__init__()
-        self.issues = []               # list to store detected issues
+        self.issues = []               # list of (code, message, line) tuples
+        self._issue_keys = set()       # issues already recorded, for duplicate suppression
         self.assignments = {}          # track variable assignments with line numbers
-        self.usages = {}               # track variable usages with line numbers
+        self.usages = set()            # names that are read at least once
         self.loop_depth = 0            # counter for loop nesting depth
         self.scopes = [{}]             # stack of variable scopes (starting with global scope)
         self.current_function = None   # name of the function currently being analyzed
         self.functions = {}            # store function information like returns and line numbers
-        self.imports = set()           # set of imported module names
+        self.import_lineno = {}        # imported name -> line number of the import
         self.used_imports = set()      # set of imports that are actually used
         self.class_names = set()       # set of defined class names
         self.global_scope = {}         # dictionary representing the global scope
         self.current_scope = self.global_scope  # the current scope being analyzed
+        self._visible = {}             # merged view of every name visible in the current scope chain
+        self._visible_stack = []       # snapshots of _visible taken on scope entry
         self.global_vars = set()       # set of variables declared as global
         self.nonlocal_vars = set()     # set of variables declared as nonlocal
+        self._with_ctx_ids = set()     # ids of nodes inside with-statement context expressions
 
-        # collect built-in function names and keywords to avoid false positives
-        self.built_in_names = set(dir(builtins)).union(set(keyword.kwlist))
-        # optionally, include methods of basic built-in types to the set
-        type_methods = []
-        for typ in (str, list, dict, tuple, set):
-            # add methods of each type, excluding special methods (__methods__)
-            type_methods.extend([method for method in dir(typ) if not method.startswith('__')])
-        self.built_in_names.update(type_methods)
+        # built-in names and keywords (precomputed at import) to avoid false positives
+        self.built_in_names = _BUILT_IN_NAMES
         self.module_level_assignments = {} # For checking constant naming
 
     def _add_issue(self, code, message, line, col=0):
-        """Helper to add issues with PEP 8 code if applicable."""
-        self.issues.append(f"{code}: {message} (line {line})")
-
-    def generic_visit(self, node):
-        """override generic_visit to set parent references for nodes.
-        this helps in navigating the ast when parent nodes are needed.
+        """Helper to add issues with PEP 8 code if applicable.
+        issues are stored as (code, message, line) tuples and only
+        formatted into strings once, when analyze_code returns.
+        exact duplicates are dropped so consumers never have to dedupe.
         """
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, ast.AST): # Ensure child is an AST node
-                child.parent = node               # set the parent attribute
-        super().generic_visit(node)           # continue the generic visit
+        key = (code, message, line)
+        if key in self._issue_keys:
+            return
+        self._issue_keys.add(key)
+        self.issues.append(key)
+
+    def _define(self, name, kind):
+        """record a name in the current scope and the merged visibility map."""
+        self.current_scope[name] = kind
+        self._visible[name] = kind
+
+    def _push_scope(self):
+        """enter a new scope, snapshotting the merged visibility map.
+        returns the previous scope so the caller can restore it on exit.
+        """
+        prev_scope = self.current_scope
+        self.scopes.append({})
+        self.current_scope = self.scopes[-1]
+        self._visible_stack.append(self._visible)
+        self._visible = dict(self._visible)
+        return prev_scope
 
-    def visit_Module(self, node):
+    def _pop_scope(self, prev_scope):
+        """leave the current scope, restoring the snapshot taken on entry."""
+        self.scopes.pop()
+        self.current_scope = prev_scope
+        self._visible = self._visible_stack.pop()
+
+    def visit(self, node, parent=None):
+        """walk the tree iteratively with an explicit stack instead of
+        recursing, so a large module costs no Python stack frame per node
+        and deep ASTs cannot hit the recursion limit. handlers are looked
+        up in a precomputed type table, run their pre-visit work, and may
+        return a callback that the driver invokes once the node's whole
+        subtree has been processed (scope pops, per-function summaries).
+        """
+        stack = [(node, parent)]
+        while stack:
+            entry = stack.pop()
+            if type(entry) is not tuple:
+                entry()  # post-visit callback
+                continue
+            current, current_parent = entry
+            handler = _DISPATCH.get(type(current))
+            post = handler(self, current, current_parent) if handler is not None else None
+            if post is not None:
+                stack.append(post)
+            # push children in reverse so they pop in source order, each
+            # above the post-visit callback of its parent
+            stack.extend((child, current) for child in reversed(list(ast.iter_child_nodes(current))))
+
+    def visit_Module(self, node, parent=None):
         """visit the module node to start analysis and check for unused imports after traversal."""
         self.current_scope = self.global_scope  # set the current scope to global
-        
-        # Check for module-level constant naming after all assignments are processed
-        # This is a heuristic: if assigned at module level and all upper, it's a constant.
-        # If reassigned later, it's not a constant. This basic check won't catch reassignments.
-        for child_node in node.body:
-            if isinstance(child_node, ast.Assign):
-                for target in child_node.targets:
-                    if isinstance(target, ast.Name):
-                        self.module_level_assignments[target.id] = target.lineno
-                        # Heuristic for constants: if all caps, assume it's a constant
-                        # A more robust check would verify it's not reassigned.
-                        if not re.match(r'^[A-Z_][A-Z0-9_]*$', target.id) and target.id.isupper():
-                            self._add_issue("C0103", f"Constant '{target.id}' should be in UPPER_CASE_WITH_UNDERSCORES", target.lineno)
-
-
-        self.generic_visit(node)                # recursively visit all child nodes
-        unused_imports = self.imports - self.used_imports  # determine unused imports
-        for imp_name, imp_lineno in self.imports: # Store imports as (name, lineno)
-            if imp_name not in self.used_imports:
-                 self._add_issue("W0611", f"Unused import '{imp_name}'", imp_lineno)
-
-
-    def visit_Import(self, node):
+        # module-level assignments are recorded by handle_assignment as the
+        # body is traversed, so no separate pre-pass over node.body is needed
+
+        def _finish():
+            # runs after the whole module body has been visited
+            for imp_name, imp_lineno in self.import_lineno.items():
+                if imp_name not in self.used_imports:
+                    self._add_issue("W0611", f"Unused import '{imp_name}'", imp_lineno)
+        return _finish
+
+
+    def visit_Import(self, node, parent=None):
         """record imported module names and add them to the current scope. Check E401."""
         if len(node.names) > 1:
             self._add_issue("E401", "Multiple imports on one line", node.lineno)
         for alias in node.names:
-            import_name = alias.asname or alias.name  # use alias if present
-            self.imports.add((import_name, node.lineno)) # Store with line number
-            self.current_scope[import_name] = 'import'  # mark as imported in current scope
-        self.generic_visit(node)
+            import_name = sys.intern(alias.asname or alias.name)  # use alias if present
+            self.import_lineno[import_name] = node.lineno
+            self._define(import_name, 'import')  # mark as imported in current scope
 
-    def visit_ImportFrom(self, node):
+    def visit_ImportFrom(self, node, parent=None):
         """record names imported from a module and add them to the current scope. Check E401."""
         # E401 for 'from foo import a, b' is generally accepted by linters like Flake8,
         # but pycodestyle might flag it if it's too long.
         # For simplicity, we won't flag E401 here unless it's multiple 'from x import y; from a import b'
         # which AST parses as separate ImportFrom nodes.
         for alias in node.names:
-            import_name = alias.asname or alias.name
-            self.imports.add((import_name, node.lineno))
-            self.current_scope[import_name] = 'import'
-        self.generic_visit(node)
+            import_name = sys.intern(alias.asname or alias.name)
+            self.import_lineno[import_name] = node.lineno
+            self._define(import_name, 'import')
 
-    def visit_ClassDef(self, node):
+    def visit_ClassDef(self, node, parent=None):
         """check class naming conventions and create a new scope for the class."""
-        self.current_scope[node.name] = 'class'  # add class name to current scope
+        self._define(node.name, 'class')         # add class name to current scope
         self.class_names.add(node.name)          # add to set of class names
-        if not re.match(r'^[A-Z][a-zA-Z0-9]*$', node.name):
+        if not _is_capwords(node.name):
             # report naming violation if not in camelcase
             self._add_issue("C0103", f"Class '{node.name}' should be in CapWords (CamelCase) format", node.lineno)
-        self.scopes.append({})                   # create a new scope for the class
-        prev_scope = self.current_scope          # save current scope
-        self.current_scope = self.scopes[-1]     # set current scope to class scope
-        self.generic_visit(node)                 # visit child nodes within the class
-        self.scopes.pop()                        # restore the previous scope
-        self.current_scope = prev_scope
+        prev_scope = self._push_scope()          # create a new scope for the class
 
-    def visit_FunctionDef(self, node):
+        def _leave():
+            self._pop_scope(prev_scope)          # restore the previous scope
+        return _leave
+
+    def visit_FunctionDef(self, node, parent=None):
         """check function naming conventions, docstrings, and prepare for return analysis.
         this function also creates a new scope for the function and adds its parameters to the scope.
         after visiting the function body, it checks for inconsistent return statements.
         """
         if not (node.name.startswith('__') and node.name.endswith('__')):
             # check if function name is in snake_case
-            if not re.match(r'^[a-z_][a-z0-9_]*$', node.name):
+            if not _is_snake(node.name):
                 self._add_issue("C0103", f"Function '{node.name}' should be in snake_case", node.lineno)
         if not ast.get_docstring(node):
             # report missing docstring
             self._add_issue("C0111", f"Function '{node.name}' is missing a docstring", node.lineno)
         
-        # Check argument names
-        for arg in node.args.args:
-            if not re.match(r'^[a-z_][a-z0-9_]*$', arg.arg) and arg.arg != 'self' and arg.arg != 'cls':
-                 self._add_issue("C0103", f"Argument '{arg.arg}' in function '{node.name}' should be in snake_case", arg.lineno)
+        # gather every kind of argument once, tagged with its report label
+        checked_args = [(arg, "Argument '{}'") for arg in node.args.args]
         if node.args.vararg:
-            if not re.match(r'^[a-z_][a-z0-9_]*$', node.args.vararg.arg):
-                 self._add_issue("C0103", f"Variable argument '*{node.args.vararg.arg}' in function '{node.name}' should be in snake_case", node.args.vararg.lineno)
+            checked_args.append((node.args.vararg, "Variable argument '*{}'"))
         if node.args.kwarg:
-            if not re.match(r'^[a-z_][a-z0-9_]*$', node.args.kwarg.arg):
-                 self._add_issue("C0103", f"Keyword argument '**{node.args.kwarg.arg}' in function '{node.name}' should be in snake_case", node.args.kwarg.lineno)
+            checked_args.append((node.args.kwarg, "Keyword argument '**{}'"))
         for arg in node.args.kwonlyargs:
-            if not re.match(r'^[a-z_][a-z0-9_]*$', arg.arg):
-                 self._add_issue("C0103", f"Keyword-only argument '{arg.arg}' in function '{node.name}' should be in snake_case", arg.lineno)
+            checked_args.append((arg, "Keyword-only argument '{}'"))
+
+        prev_scope = self._push_scope()   # create a new scope for the function
+        # one fused pass both checks argument naming and populates the scope
+        for arg, label in checked_args:
+            arg_name = arg.arg
+            if arg_name not in {'self', 'cls'} and not _is_snake(arg_name):
+                 self._add_issue("C0103", f"{label.format(arg_name)} in function '{node.name}' should be in snake_case", arg.lineno)
+            self._define(arg_name, 'param')
 
         for arg_default in node.args.defaults:
             # check for mutable default arguments
@@ -145,23 +268,12 @@ class CodeAnalyzer(ast.NodeVisitor):
 
         self.current_function = node.name  # set the current function name
         self.functions[node.name] = {'returns': [], 'lineno': node.lineno}  # initialize function return tracking
-        self.scopes.append({})            # create a new scope for the function
-        prev_scope = self.current_scope   # save the previous scope
-        self.current_scope = self.scopes[-1]  # set current scope to function scope
-        # add function parameters to the current scope
-        for arg in node.args.args:
-            self.current_scope[arg.arg] = 'param'
-        if node.args.vararg:
-            self.current_scope[node.args.vararg.arg] = 'param'
-        if node.args.kwarg:
-            self.current_scope[node.args.kwarg.arg] = 'param'
-        for arg in node.args.kwonlyargs:
-            self.current_scope[arg.arg] = 'param'
-        self.generic_visit(node)          # visit the function body
-        self.scopes.pop()                 # restore the previous scope
-        self.current_scope = prev_scope
-        self.check_return_consistency(node)  # check for inconsistent return statements
-        self.current_function = None      # clear the current function
+
+        def _leave():
+            self._pop_scope(prev_scope)       # restore the previous scope
+            self.check_return_consistency(node)  # check for inconsistent return statements
+            self.current_function = None      # clear the current function
+        return _leave
 
     def check_return_consistency(self, node):
         """check for inconsistent return statements within a function.
@@ -173,186 +285,194 @@ class CodeAnalyzer(ast.NodeVisitor):
                 # report inconsistency if there's a mix of returns with and without values
                 self._add_issue("W0631", f"Inconsistent return statements in function '{node.name}'", node.lineno)
 
-    def visit_Return(self, node):
+    def visit_Return(self, node, parent=None):
         """record return statements to analyze consistency within the function."""
         if self.current_function:
             has_value = node.value is not None  # determine if return statement has a value
             self.functions[self.current_function]['returns'].append(has_value)
-        self.generic_visit(node)
 
-    def visit_Assign(self, node):
+    def visit_Assign(self, node, parent=None):
         """handle variable assignments and track them for usage analysis. Check E731."""
-        if isinstance(node.value, ast.Lambda):
-            if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        if type(node.value) is ast.Lambda:
+            if len(node.targets) == 1 and type(node.targets[0]) is ast.Name:
                 self._add_issue("E731", f"Do not assign a lambda expression, use a 'def' for '{node.targets[0].id}'", node.lineno)
 
         for target in node.targets:
-            self.handle_assignment(target, is_module_level=isinstance(node.parent, ast.Module))
-        self.generic_visit(node)
+            self.handle_assignment(target, is_module_level=type(parent) is ast.Module)
 
     def handle_assignment(self, target, is_module_level=False):
         """process different types of assignment targets (e.g., variables, tuples).
         this function tracks variable assignments and warns if a built-in name is being shadowed.
         Checks for variable naming conventions (snake_case) and constant naming (UPPER_CASE).
         """
-        if isinstance(target, ast.Name):
-            var_name = target.id
+        if type(target) is ast.Name:
+            # bind the hot attributes once; the loop over tuple targets and
+            # the checks below then work on locals instead of repeating the
+            # self lookups
+            add_issue = self._add_issue
+            lineno = target.lineno
+            # interned so scope and builtin membership tests hit the
+            # pointer-equality fast path
+            var_name = sys.intern(target.id)
             if var_name in self.built_in_names:
                 # warn if assigning to a built-in name
-                self._add_issue("W0622", f"Redefining built-in '{var_name}'", target.lineno)
-            
+                add_issue("W0622", f"Redefining built-in '{var_name}'", lineno)
+
             # Naming conventions
             # Heuristic: if module level and all upper, it's a constant. Otherwise, snake_case.
-            is_likely_constant = is_module_level and var_name.isupper() and not var_name.islower()
+            is_likely_constant = is_module_level and _case_bits(var_name) == 1
 
             if is_likely_constant:
-                if not re.match(r'^[A-Z_][A-Z0-9_]*$', var_name):
-                    self._add_issue("C0103", f"Constant '{var_name}' should be in UPPER_CASE_WITH_UNDERSCORES", target.lineno)
+                if not _is_upper_const(var_name):
+                    add_issue("C0103", f"Constant '{var_name}' should be in UPPER_CASE_WITH_UNDERSCORES", lineno)
             elif not (var_name.startswith('__') and var_name.endswith('__')): # Allow dunder names
                  # Exclude class names which are handled in visit_ClassDef
-                if var_name not in self.class_names and not re.match(r'^[a-z_][a-z0-9_]*$', var_name):
+                if var_name not in self.class_names and not _is_snake(var_name):
                     # Check if it's a CapWords name that might be a class instance, be less strict here
                     # or assume variables should always be snake_case unless it's a known class type.
                     # For simplicity, we'll flag if not snake_case and not a known class name.
-                    if not re.match(r'^[A-Z][a-zA-Z0-9]*$', var_name): # Avoid flagging CapWords if it's not a class
-                        self._add_issue("C0103", f"Variable '{var_name}' should be in snake_case", target.lineno)
+                    if not _is_capwords(var_name): # Avoid flagging CapWords if it's not a class
+                        add_issue("C0103", f"Variable '{var_name}' should be in snake_case", lineno)
 
 
-            self.current_scope[var_name] = 'assigned'     # mark variable as assigned in current scope
-            self.assignments[var_name] = target.lineno    # record the line number of assignment
+            self._define(var_name, 'assigned')        # mark variable as assigned in current scope
+            self.assignments[var_name] = lineno       # record the line number of assignment
             if is_module_level:
-                self.module_level_assignments[var_name] = target.lineno
+                self.module_level_assignments[var_name] = lineno
         elif isinstance(target, (ast.Tuple, ast.List)):
+            handle = self.handle_assignment
             for elt in target.elts:
-                self.handle_assignment(elt, is_module_level)  # recursively handle each element
-        elif isinstance(target, ast.Attribute):
+                handle(elt, is_module_level)  # recursively handle each element
+        elif type(target) is ast.Attribute:
             pass  # skip assignments to attributes (e.g., self.value)
 
-    def visit_Name(self, node):
+    def visit_Name(self, node, parent=None):
         """check if variables are defined before use and track usages."""
-        if isinstance(node.ctx, ast.Load):
+        if type(node.ctx) is ast.Load:
+            nid = node.id
+            # the attributes touched on every load, bound once up front
+            import_lineno = self.import_lineno
+            usages = self.usages
+            # fast path: most loads reference a name defined right in the
+            # innermost scope (parameters and fresh locals), so one dict
+            # probe settles the defined-check
+            if nid in self.current_scope:
+                usages.add(nid)
+                if nid in import_lineno:
+                    self.used_imports.add(nid)
+                return
             # variable is being read
-            if not self.is_name_defined(node.id):
-                if node.id not in self.built_in_names:
+            if not self.is_name_defined(nid):
+                if nid not in self.built_in_names:
                     # report error if variable is used before assignment
-                    self._add_issue("E0602", f"Undefined variable '{node.id}'", node.lineno)
-            self.usages[node.id] = node.lineno  # record variable usage
-            
+                    self._add_issue("E0602", f"Undefined variable '{nid}'", node.lineno)
+            usages.add(nid)  # record that the name was used
+
             # Check if the used name corresponds to an import
-            for imp_name, _ in self.imports:
-                if node.id == imp_name:
-                    self.used_imports.add(imp_name) # Mark the specific name as used
-                    break
-        elif isinstance(node.ctx, ast.Store):
+            if nid in import_lineno:
+                self.used_imports.add(nid) # Mark the specific name as used
+        elif type(node.ctx) is ast.Store:
             # variable is being assigned - handled by visit_Assign/handle_assignment
             # but ensure it's marked in scope if not already
             if node.id not in self.current_scope:
-                 self.current_scope[node.id] = 'assigned'
-        self.generic_visit(node)
+                 self._define(node.id, 'assigned')
 
     def is_name_defined(self, name):
         """determine if a variable or name is defined in accessible scopes.
         checks local scopes, global scope, class names, imports, and built-in names.
         """
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return True  # found in local or enclosing scope
+        if name in self._visible:
+            return True     # found in the merged scope chain
         if name in self.global_scope:
-            return True     # found in global scope
+            return True     # found in global scope (e.g. declared global elsewhere)
         if name in self.class_names:
             return True     # name matches a class
-        for imp_name, _ in self.imports: # Check against stored import names
-            if name == imp_name:
-                return True
+        if name in self.import_lineno:
+            return True     # name matches an import
         if name in self.built_in_names:
             return True     # name matches a built-in
         return False        # name is undefined
 
-    def visit_Global(self, node):
+    def visit_Global(self, node, parent=None):
         """record variables declared as global."""
         for name in node.names:
             self.global_vars.add(name)            # add to global variables set
             self.global_scope[name] = 'global'    # mark in global scope
+            self._visible[name] = 'global'        # immediately visible in this scope chain
 
-    def visit_Nonlocal(self, node):
+    def visit_Nonlocal(self, node, parent=None):
         """record variables declared as nonlocal."""
         for name in node.names:
             self.nonlocal_vars.add(name)          # add to nonlocal variables set
 
-    def visit_For(self, node):
+    def visit_For(self, node, parent=None):
         """check for deeply nested loops and create a new scope for loop variables."""
         self.loop_depth += 1
         if self.loop_depth > 2: # This is a custom rule, not strictly PEP 8
             # report if loop nesting is too deep
             self._add_issue("C0200", f"Nested loop too deep", node.lineno) # Example custom code
-        self.scopes.append({})                    # create a new scope for the loop
-        prev_scope = self.current_scope
-        self.current_scope = self.scopes[-1]
-        self.handle_assignment(node.target, is_module_level=isinstance(node.parent, ast.Module)) # handle the loop variable assignment
-        self.generic_visit(node)
-        self.scopes.pop()                         # restore the previous scope
-        self.current_scope = prev_scope
-        self.loop_depth -= 1
+        prev_scope = self._push_scope()           # create a new scope for the loop
+        self.handle_assignment(node.target, is_module_level=type(parent) is ast.Module) # handle the loop variable assignment
 
-    def visit_While(self, node):
+        def _leave():
+            self._pop_scope(prev_scope)           # restore the previous scope
+            self.loop_depth -= 1
+        return _leave
+
+    def visit_While(self, node, parent=None):
         """check for infinite loops and deeply nested loops; create a new scope."""
         self.loop_depth += 1
         if self.loop_depth > 2: # Custom rule
             self._add_issue("C0200", f"Nested loop too deep", node.lineno)
-        if isinstance(node.test, ast.Constant) and node.test.value is True:
+        if type(node.test) is ast.Constant and node.test.value is True:
             # detect possible infinite loops without a break statement
-            has_break = any(isinstance(child, ast.Break) for child in ast.walk(node))
-            if not has_break:
+            if not _has_break(node):
                 self._add_issue("W0104", f"Possible infinite loop (while True without break)", node.lineno)
-        self.scopes.append({})                    # create a new scope for the loop
-        prev_scope = self.current_scope
-        self.current_scope = self.scopes[-1]
-        self.generic_visit(node)
-        self.scopes.pop()                         # restore the previous scope
-        self.current_scope = prev_scope
-        self.loop_depth -= 1
+        prev_scope = self._push_scope()           # create a new scope for the loop
 
-    def visit_Compare(self, node):
+        def _leave():
+            self._pop_scope(prev_scope)           # restore the previous scope
+            self.loop_depth -= 1
+        return _leave
+
+    def visit_Compare(self, node, parent=None):
         """Check for PEP 8 comparison issues: E711, E712, E721."""
-        # E711: comparison to None should be 'is None' or 'is not None'
+        # build the operand chain once: operands i and i+1 surround ops[i]
+        operands = [node.left, *node.comparators]
         for i, op in enumerate(node.ops):
-            comparator = node.comparators[i]
+            left = operands[i]
+            right = operands[i + 1]
             if isinstance(op, (ast.Eq, ast.NotEq)):
-                left_is_none = isinstance(node.left if i == 0 else node.comparators[i-1], ast.Constant) and \
-                               (node.left if i == 0 else node.comparators[i-1]).value is None
-                right_is_none = isinstance(comparator, ast.Constant) and comparator.value is None
-                if left_is_none or right_is_none:
+                left_kind = _const_kind(left)
+                right_kind = _const_kind(right)
+                # E711: comparison to None should be 'is None' or 'is not None'
+                if left_kind == _CONST_NONE or right_kind == _CONST_NONE:
                     self._add_issue("E711", "Comparison to None should be 'is None' or 'is not None'", node.lineno)
 
                 # E712: comparison to True/False should be 'is True/False' or 'if cond:'
-                left_is_bool = isinstance(node.left if i == 0 else node.comparators[i-1], ast.Constant) and \
-                               isinstance((node.left if i == 0 else node.comparators[i-1]).value, bool)
-                right_is_bool = isinstance(comparator, ast.Constant) and isinstance(comparator.value, bool)
-                if left_is_bool or right_is_bool:
+                if left_kind == _CONST_BOOL or right_kind == _CONST_BOOL:
                      self._add_issue("E712", "Comparison to True/False should be 'is True/False' or direct use of boolean", node.lineno)
-            
+
             # E721: do not compare types, use isinstance()
-            if isinstance(op, ast.Is) or isinstance(op, ast.IsNot): # Also check 'is' for type comparison
-                left_is_type_call = isinstance(node.left if i == 0 else node.comparators[i-1], ast.Call) and \
-                                    isinstance((node.left if i == 0 else node.comparators[i-1]).func, ast.Name) and \
-                                    (node.left if i == 0 else node.comparators[i-1]).func.id == 'type'
-                right_is_type_call = isinstance(comparator, ast.Call) and \
-                                     isinstance(comparator.func, ast.Name) and \
-                                     comparator.func.id == 'type'
+            elif isinstance(op, (ast.Is, ast.IsNot)): # Also check 'is' for type comparison
+                left_is_type_call = type(left) is ast.Call and \
+                                    type(left.func) is ast.Name and \
+                                    left.func.id == 'type'
+                right_is_type_call = type(right) is ast.Call and \
+                                     type(right.func) is ast.Name and \
+                                     right.func.id == 'type'
                 if left_is_type_call and right_is_type_call:
                      self._add_issue("E721", "Do not compare types directly, use isinstance()", node.lineno)
-        self.generic_visit(node)
 
 
-    def visit_BinOp(self, node):
+    def visit_BinOp(self, node, parent=None):
         """check for division by zero errors in binary operations."""
         if isinstance(node.op, (ast.Div, ast.FloorDiv, ast.Mod)):
-            if isinstance(node.right, ast.Constant) and node.right.value == 0:
+            if type(node.right) is ast.Constant and node.right.value == 0:
                 # report division by zero error
                 self._add_issue("E0001", f"Division by zero", node.lineno) # Using a generic error code
-        self.generic_visit(node)
 
-    def visit_Try(self, node):
+    def visit_Try(self, node, parent=None):
         """check try-except blocks for empty except blocks and broad exceptions."""
         for handler in node.handlers:
             if not handler.body:
@@ -361,58 +481,57 @@ class CodeAnalyzer(ast.NodeVisitor):
             if handler.type is None:
                 # report bare except clause (E722)
                 self._add_issue("E722", f"Do not use bare 'except:'", handler.lineno)
-            elif isinstance(handler.type, ast.Name) and handler.type.id == 'Exception':
+            elif type(handler.type) is ast.Name and handler.type.id == 'Exception':
                 # report catching of broad exception 'exception'
                 self._add_issue("W0703", f"Catching too general exception 'Exception'", handler.lineno)
-        self.generic_visit(node)
 
-    def visit_Call(self, node):
+    def visit_With(self, node, parent=None):
+        """record context-manager expressions so visit_Call can tell whether
+        an open() call is managed by a with statement without parent walks."""
+        for item in node.items:
+            for sub in ast.walk(item.context_expr):
+                self._with_ctx_ids.add(id(sub))
+
+    def visit_Call(self, node, parent=None):
         """check for resource leaks when using 'open' without a 'with' statement and mark used imports."""
-        if isinstance(node.func, ast.Name):
+        if type(node.func) is ast.Name:
             func_name = node.func.id
             if func_name == 'open':
-                # Check if 'open' is part of a 'with' statement
-                current_node = node
-                in_with_statement = False
-                while hasattr(current_node, 'parent'):
-                    if isinstance(current_node.parent, ast.With):
-                        # Check if this 'open' call is one of the items in the 'with'
-                        for item in current_node.parent.items:
-                            if item.context_expr == current_node:
-                                in_with_statement = True
-                                break
-                        if in_with_statement:
-                            break 
-                    current_node = current_node.parent
-                if not in_with_statement:
+                if id(node) not in self._with_ctx_ids:
                     self._add_issue("W6001", f"File opened without 'with' statement", node.lineno) # Custom warning code
 
             # Mark import as used
-            for imp_name, _ in self.imports:
-                if func_name == imp_name:
-                    self.used_imports.add(imp_name)
-                    break
-        elif isinstance(node.func, ast.Attribute): # For method calls like 'module.function()'
+            if func_name in self.import_lineno:
+                self.used_imports.add(func_name)
+        elif type(node.func) is ast.Attribute: # For method calls like 'module.function()'
             # Try to resolve the base module/object name
             obj = node.func.value
-            if isinstance(obj, ast.Name):
-                for imp_name, _ in self.imports:
-                    if obj.id == imp_name:
-                        self.used_imports.add(imp_name)
-                        break
-        self.generic_visit(node)
+            if type(obj) is ast.Name:
+                if obj.id in self.import_lineno:
+                    self.used_imports.add(obj.id)
 
     def report_unused(self):
         """report variables that are assigned but never used in the code."""
         for var, lineno in self.assignments.items():
-            # Check if var is in any import name (first element of tuple)
-            is_an_import = any(var == imp_name for imp_name, _ in self.imports)
-            if var not in self.usages and not is_an_import:
+            if var not in self.usages and var not in self.import_lineno:
                 if var not in self.built_in_names:
                     # report unused variable
                     self._add_issue("W0612", f"Unused variable '{var}'", lineno)
 
-# Removed the duplicate generic_visit method that was here.
+# node type -> handler table built once from the visit_* methods above, so
+# dispatch is a single dict lookup keyed on type(node)
+_DISPATCH = {
+    getattr(ast, name[6:]): method
+    for name, method in vars(CodeAnalyzer).items()
+    if name.startswith('visit_') and hasattr(ast, name[6:])
+}
+
+# results of recent analyze_code calls, keyed by a digest of the source.
+# re-analyzing unchanged code (the common case when the user clicks
+# ANALYZE repeatedly) becomes a hash plus a dict lookup. insertion order
+# doubles as age, so eviction drops the oldest entry first.
+_CACHE: dict[bytes, list[str]] = {}
+_CACHE_MAX = 256
 
 def analyze_code(source_code):
     """analyze the provided source code for issues using the codeanalyzer.
@@ -421,12 +540,21 @@ def analyze_code(source_code):
     returns:
         list: a list of detected issues in the code.
     """
+    key = hashlib.blake2b(source_code.encode(), digest_size=16).digest()
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         tree = ast.parse(source_code)         # parse the source code into an ast
         analyzer = CodeAnalyzer()             # create an instance of the analyzer
         analyzer.visit(tree)                  # visit each node in the ast
         analyzer.report_unused()              # report any unused variables
-        return analyzer.issues                # return the list of issues found
+        # format the structured issues into strings in one pass at the end
+        results = [f"{code}: {message} (line {line})" for code, message, line in analyzer.issues]
     except SyntaxError as e:
         # return syntax error details if parsing fails
-        return [f"E999: SyntaxError: {e.msg} at line {e.lineno}, column {e.offset}"]
\ No newline at end of file
+        results = [f"E999: SyntaxError: {e.msg} at line {e.lineno}, column {e.offset}"]
+    if len(_CACHE) >= _CACHE_MAX:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[key] = results
+    return results
\ No newline at end of file
@@ -0,0 +1,21 @@
+# Optional build script: compiles SyntaxAnalyzer.py into a C extension
+# with mypyc for a faster analyzer. The plain .py file keeps working when
+# no compiled module is present, so this step is entirely optional.
+#
+# Usage:
+#   pip install mypy setuptools
+#   python setup.py build_ext --inplace
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    raise SystemExit(
+        "mypyc is not installed; run 'pip install mypy' to build the "
+        "compiled analyzer (the pure-Python version works without it)."
+    )
+
+setup(
+    name='syntax-analysis-tool',
+    ext_modules=mypycify(['SyntaxAnalyzer.py']),
+)